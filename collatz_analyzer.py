@@ -8,21 +8,189 @@ con múltiples visualizaciones y análisis estadísticos.
 
 # Bibliotecas estándar
 import os
+import gzip
 import json
+import math
+import pickle
 import random
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from io import BytesIO
 from pathlib import Path
 
 # Bibliotecas de visualización y análisis numérico
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
+from matplotlib.collections import LineCollection
 from matplotlib.widgets import Button, Slider
 from matplotlib import style
 
+# Numba es opcional: si está disponible, las secuencias que caben en 64 bits
+# se calculan con un núcleo compilado; si no, se usa la ruta pura de Python.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# imageio es opcional y solo se necesita para exportar animaciones a vídeo
+try:
+    import imageio.v3 as iio
+except ImportError:
+    iio = None
+
 # Configuración del estilo visual para las gráficas
 style.use('ggplot')
 
+# Mayor valor impar cuyo paso 3n+1 no desborda un entero sin signo de 64 bits
+_U64_IMPAR_MAX = np.uint64((2 ** 64 - 2) // 3)
+
+if njit is not None:
+    @njit(cache=True, nogil=True, boundscheck=False)
+    def _collatz_u64(n, out):
+        """
+        Rellena `out` con la secuencia de Collatz de n y devuelve su longitud.
+
+        Devuelve -1 si la secuencia desborda el buffer o los 64 bits, en cuyo
+        caso el llamador debe recurrir a la ruta pura de Python. El núcleo
+        libera el GIL, de modo que varias secuencias pueden calcularse en
+        paralelo desde hilos de Python.
+
+        Toda la aritmética usa constantes uint64 explícitas: mezclar uint64
+        con literales con signo haría que Numba promoviera las operaciones
+        a float64 y corrompiera los valores grandes.
+        """
+        cero = np.uint64(0)
+        uno = np.uint64(1)
+        tres = np.uint64(3)
+        i = 0
+        while n != uno:
+            if i >= out.size - 1:
+                return -1
+            out[i] = n
+            i += 1
+            if n & uno == cero:
+                n >>= uno
+            else:
+                if n > _U64_IMPAR_MAX:
+                    return -1
+                n = tres * n + uno
+        out[i] = uno
+        return i + 1
+
+    @njit(cache=True, nogil=True)
+    def _posiciones_arbol(paridad):
+        """
+        Calcula las posiciones del árbol de Collatz a partir de la paridad.
+
+        Una sola pasada compilada que escribe directamente los dos arrays
+        de salida: derecha si el valor anterior era par, izquierda si era
+        impar, siempre medio paso hacia abajo.
+        """
+        n = paridad.size
+        x = np.empty(n, np.int32)
+        y = np.empty(n, np.float32)
+        x[0] = 0
+        y[0] = 0.0
+        for i in range(1, n):
+            if paridad[i - 1] == 0:
+                x[i] = x[i - 1] + 1
+            else:
+                x[i] = x[i - 1] - 1
+            y[i] = y[i - 1] - np.float32(0.5)
+        return x, y
+
+def _renderizar_fotograma(args):
+    """
+    Dibuja un único fotograma de la animación y lo devuelve como imagen RGB.
+
+    Es una función de módulo (y no un método) para que ProcessPoolExecutor
+    pueda serializarla y repartir los fotogramas entre procesos. Usa el
+    backend Agg directamente, sin pyplot, para no tocar estado global de
+    matplotlib en los procesos hijos.
+
+    Args:
+        args (tuple): Tupla (i, xs, ys, numero_inicial) con el índice del
+            fotograma, los datos completos y el número analizado
+
+    Returns:
+        np.ndarray: Imagen del fotograma decodificada con imageio
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    i, xs, ys, numero_inicial = args
+
+    fig = Figure(figsize=(10, 6), dpi=80)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    ax.plot(xs, ys, 'gray', alpha=0.3)
+    ax.plot(xs[:i+1], ys[:i+1], 'b-')
+    ax.set_title(f'Conjetura de Collatz para n = {numero_inicial:,}')
+    ax.set_xlabel('Pasos')
+    ax.set_ylabel('Valor')
+    ax.grid(True)
+
+    buffer = BytesIO()
+    fig.savefig(buffer, format='png')
+    buffer.seek(0)
+    return iio.imread(buffer)
+
+
+class _BlitManager:
+    """
+    Gestor de blitting manual para animaciones.
+
+    Captura el fondo estático del lienzo una sola vez y, en cada
+    actualización, lo restaura, dibuja únicamente los artistas animados y
+    vuelca el resultado, evitando recomponer la figura completa (ejes,
+    rejilla, leyendas) en cada fotograma.
+    """
+
+    def __init__(self, canvas, artistas=()):
+        """
+        Args:
+            canvas: Lienzo de la figura (fig.canvas)
+            artistas (iterable): Artistas que cambian en cada fotograma
+        """
+        self.canvas = canvas
+        self._fondo = None
+        self._artistas = []
+        for artista in artistas:
+            self.agregar_artista(artista)
+        # Recapturar el fondo cada vez que el lienzo se redibuje completo
+        # (por ejemplo, al redimensionar la ventana)
+        canvas.mpl_connect('draw_event', self._al_dibujar)
+
+    def agregar_artista(self, artista):
+        """Registra un artista animado para dibujarlo en cada fotograma."""
+        artista.set_animated(True)
+        self._artistas.append(artista)
+
+    def _al_dibujar(self, evento):
+        """Captura el fondo estático tras un redibujado completo."""
+        if evento is not None and evento.canvas is not self.canvas:
+            return
+        self._fondo = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self._dibujar_animados()
+
+    def _dibujar_animados(self):
+        """Dibuja solo los artistas animados sobre el fondo actual."""
+        for artista in self._artistas:
+            self.canvas.figure.draw_artist(artista)
+
+    def actualizar(self):
+        """Restaura el fondo, dibuja los artistas animados y vuelca al lienzo."""
+        if self._fondo is None:
+            self._al_dibujar(None)
+        else:
+            self.canvas.restore_region(self._fondo)
+            self._dibujar_animados()
+            self.canvas.blit(self.canvas.figure.bbox)
+        self.canvas.flush_events()
+
+
 class CollatzAnalyzer:
     """
     Clase principal para el análisis y visualización de la Conjetura de Collatz.
@@ -53,48 +221,182 @@ class CollatzAnalyzer:
         # Configuración de animación
         self.animation_speed = 200  # Milisegundos entre fotogramas
         self.current_animation = None  # Referencia a la animación actual
+
+        # Caché LRU de sufijos de secuencias: valor -> secuencia restante hasta 1.
+        # La mayoría de las trayectorias convergen en sufijos compartidos
+        # (...16, 8, 4, 2, 1), así que basta con calcular cada sufijo una vez.
+        self._suffix_cache = OrderedDict({1: [1]})
+        self.CACHE_MAX_ENTRADAS = 2 ** 20  # Límite de entradas en la caché
+        self.CACHE_MAX_VALOR = 2 ** 40     # No se memorizan enteros gigantes
+
+        # Número máximo de puntos que se envían a matplotlib por gráfica;
+        # las secuencias más largas se submuestrean antes de dibujar
+        self.MAX_PUNTOS_GRAFICA = 4000
+
+        # Número máximo de fotogramas al exportar una animación a vídeo
+        self.MAX_FOTOGRAMAS_VIDEO = 300
+
+        # Caché persistente en disco: las secuencias calculadas se comparten
+        # entre sesiones (los ejemplos predefinidos se piden una y otra vez)
+        self.CACHE_DIR = Path.home() / '.collatz_cache'
+        self.CACHE_DISCO_MAX_ARCHIVOS = 1024  # Límite de secuencias en disco
+
+        # Máscara de paridad memorizada de la última secuencia analizada,
+        # compartida por las visualizaciones que la necesitan
+        self._ultima_secuencia = None
+        self._ultima_paridad = None
+
+        # Tabla de colas para valores pequeños: casi todas las trayectorias
+        # terminan con cientos de pasos por debajo de TABLA_MAX, así que la
+        # ruta pura de Python corta en cuanto n entra en ese rango y copia
+        # el sufijo de un buffer plano contiguo. Se construye bajo demanda.
+        self.TABLA_MAX = 1 << 16
+        self._tabla_plana = None    # Buffer int64 con todas las colas
+        self._tabla_desplaz = None  # Inicio de la cola de cada valor
+        self._tabla_pasos = None    # Longitud de la cola de cada valor
         
     def guardar_secuencia(self, numero, secuencia, archivo):
         """
-        Persiste una secuencia de Collatz en formato JSON.
-        
+        Persiste una secuencia de Collatz en formato binario compacto.
+
+        Si todos los valores caben en 64 bits la secuencia se guarda como un
+        array int64 comprimido (npz), mucho más pequeño y rápido de leer que
+        el JSON en texto; las secuencias con enteros gigantes se guardan como
+        pickle comprimido con gzip.
+
         Args:
             numero (int): Número inicial que generó la secuencia
             secuencia (list): Lista de enteros que conforman la secuencia de Collatz
             archivo (str): Ruta del archivo donde se guardará la secuencia
-            
+
         Returns:
             None
         """
-        # Estructura de datos para almacenamiento
-        datos = {
-            'numero_inicial': numero,
-            'secuencia': secuencia
-        }
-        
-        # Escritura del archivo JSON
-        with open(archivo, 'w') as f:
-            json.dump(datos, f)
-            
+        if max(secuencia) < (1 << 63):
+            # Formato binario npz: pasar el archivo ya abierto evita que
+            # numpy añada su propia extensión al nombre elegido
+            with open(archivo, 'wb') as f:
+                np.savez_compressed(f, numero=numero,
+                                    seq=np.asarray(secuencia, dtype=np.int64))
+        else:
+            # Enteros de precisión arbitraria: pickle comprimido
+            datos = {
+                'numero_inicial': numero,
+                'secuencia': [int(v) for v in secuencia]
+            }
+            with gzip.open(archivo, 'wb') as f:
+                pickle.dump(datos, f, protocol=5)
+
     def cargar_secuencia(self, archivo):
         """
-        Recupera una secuencia de Collatz desde un archivo JSON.
-        
+        Recupera una secuencia de Collatz desde un archivo.
+
+        Detecta el formato por los bytes mágicos del archivo: npz (zip),
+        pickle comprimido con gzip, o el JSON en texto de versiones
+        anteriores, que se sigue aceptando por compatibilidad.
+
         Args:
-            archivo (str): Ruta del archivo JSON que contiene la secuencia
-            
+            archivo (str): Ruta del archivo que contiene la secuencia
+
         Returns:
             tuple: Par (numero_inicial, secuencia) donde:
                 - numero_inicial (int): Valor que generó la secuencia
                 - secuencia (list): Lista de enteros que conforman la secuencia
-                
+
         Raises:
             FileNotFoundError: Si el archivo no existe
-            json.JSONDecodeError: Si el formato del archivo es inválido
+            json.JSONDecodeError: Si un archivo JSON heredado es inválido
+        """
+        with open(archivo, 'rb') as f:
+            magia = f.read(2)
+
+        if magia == b'PK':
+            # Formato npz (contenedor zip)
+            with np.load(archivo) as datos:
+                return int(datos['numero']), datos['seq'].tolist()
+        elif magia == b'\x1f\x8b':
+            # Pickle comprimido con gzip (secuencias con enteros gigantes)
+            with gzip.open(archivo, 'rb') as f:
+                datos = pickle.load(f)
+            return datos['numero_inicial'], datos['secuencia']
+        else:
+            # Formato JSON heredado
+            with open(archivo, 'r') as f:
+                datos = json.load(f)
+            return datos['numero_inicial'], datos['secuencia']
+
+    def _ruta_cache(self, n):
+        """
+        Devuelve la ruta del archivo de caché en disco para el número n.
+
+        Los archivos se reparten en subdirectorios según los últimos cuatro
+        dígitos de n para no acumular miles de entradas en un solo directorio.
         """
-        with open(archivo, 'r') as f:
-            datos = json.load(f)
-        return datos['numero_inicial'], datos['secuencia']
+        return self.CACHE_DIR / f'{n % 10000:04d}' / f'{n}.json.gz'
+
+    def _cached_collatz(self, n):
+        """
+        Calcula la secuencia de Collatz reutilizando la caché en disco.
+
+        Si la secuencia ya se calculó en una sesión anterior se carga de
+        ~/.collatz_cache en lugar de recalcularse; si no, se calcula, se
+        guarda comprimida y se acota el tamaño total de la caché. Cualquier
+        problema de disco (permisos, espacio, archivos corruptos) degrada
+        silenciosamente a recalcular sin caché.
+
+        Args:
+            n (int): Número inicial para generar la secuencia
+
+        Returns:
+            list: Secuencia completa de Collatz
+        """
+        ruta = self._ruta_cache(n)
+        if ruta.exists():
+            try:
+                with gzip.open(ruta, 'rt', encoding='ascii') as f:
+                    datos = json.load(f)
+                try:
+                    # Devolver un array uint64 cuando los valores lo permiten
+                    return np.asarray(datos, dtype=np.uint64)
+                except OverflowError:
+                    return datos
+            except (OSError, EOFError, json.JSONDecodeError):
+                # Entrada corrupta (gzip lanza EOFError si está truncada):
+                # eliminarla y recalcular
+                try:
+                    ruta.unlink()
+                except OSError:
+                    pass
+
+        secuencia = self.collatz(n)
+        try:
+            ruta.parent.mkdir(parents=True, exist_ok=True)
+            # Escritura atómica: volcar a un archivo temporal y renombrarlo,
+            # para que un proceso interrumpido no deje entradas truncadas
+            temporal = ruta.with_name(ruta.name + '.tmp')
+            try:
+                with gzip.open(temporal, 'wt', encoding='ascii') as f:
+                    if isinstance(secuencia, np.ndarray):
+                        json.dump(secuencia.tolist(), f)
+                    else:
+                        json.dump(secuencia, f)
+                os.replace(temporal, ruta)
+            finally:
+                temporal.unlink(missing_ok=True)
+            self._limpiar_cache_disco()
+        except OSError:
+            pass
+        return secuencia
+
+    def _limpiar_cache_disco(self):
+        """Acota la caché en disco eliminando los archivos más antiguos."""
+        archivos = sorted(self.CACHE_DIR.glob('*/*.json.gz'),
+                          key=lambda p: p.stat().st_mtime)
+        for ruta in archivos[:-self.CACHE_DISCO_MAX_ARCHIVOS]:
+            try:
+                ruta.unlink()
+            except OSError:
+                pass
 
     def generar_aleatorio(self):
         """
@@ -111,8 +413,8 @@ class CollatzAnalyzer:
         elif numero_inicial < 2:
             raise ValueError("El número debe ser mayor que 1")
             
-        secuencia = self.collatz(numero_inicial)
-        
+        secuencia = self._cached_collatz(numero_inicial)
+
         # Ofrecer diferentes tipos de visualización
         self.limpiar_pantalla()
         print("\n=== Opciones de Visualización ===")
@@ -149,50 +451,313 @@ class CollatzAnalyzer:
         - Si n es impar, se multiplica por 3 y se suma 1
         - Se repite hasta llegar a 1
         
+        La parte final de cada trayectoria se resuelve mediante una caché LRU
+        de sufijos: en cuanto n coincide con un valor ya calculado, el resto
+        de la secuencia se recupera de la caché en lugar de recalcularse.
+
         Args:
             n (int): Número inicial para generar la secuencia
-            
+
         Returns:
-            list: Secuencia completa de Collatz, comenzando con n y terminando en 1
+            np.ndarray | list: Secuencia completa de Collatz, comenzando con n
+            y terminando en 1. Es un array uint64 cuando toda la trayectoria
+            cabe en 64 bits (la ruta compilada), y una lista de enteros de
+            Python en el caso de enteros gigantes o sin Numba instalado.
         """
-        secuencia = [n]  # Inicializar secuencia con el número de entrada
-        
-        # Iterar hasta llegar a 1
-        while n != 1:
-            # Aplicar regla de Collatz: n/2 si es par, 3n+1 si es impar
-            n = n // 2 if n % 2 == 0 else 3 * n + 1
-            secuencia.append(n)
-            
+        # Ruta rápida: núcleo compilado con Numba para valores de 64 bits.
+        # Se devuelve el array directamente para que los consumidores
+        # trabajen vectorizados sin reconvertir la secuencia.
+        if njit is not None and n.bit_length() < 64:
+            # Cota superior generosa para la longitud de la secuencia
+            buffer = np.empty(max(64, 8 * (n.bit_length() + 1) ** 2),
+                              dtype=np.uint64)
+            longitud = _collatz_u64(np.uint64(n), buffer)
+            if longitud > 0:
+                return buffer[:longitud]
+            # Desbordamiento del buffer o de 64 bits: seguir en Python puro
+
+        cache = self._suffix_cache
+
+        # Preasignar el prefijo de una vez usando una cota holgada de la
+        # longitud de parada (del orden de log2(n), con margen de sobra);
+        # así se evitan las sucesivas duplicaciones internas de la lista
+        capacidad = max(64, 200 * n.bit_length())
+        camino = [None] * capacidad
+        cuenta = 0
+
+        # Fase 1: descenso con aritmética de precisión arbitraria. Ningún
+        # valor de esta fase cabe en la caché de sufijos (todos superan
+        # CACHE_MAX_VALOR), así que no se consulta; el colapso de tiras
+        # pares ahorra alrededor de la mitad de las operaciones bignum
+        while n.bit_length() > 63:
+            if cuenta + 64 >= capacidad:
+                camino.extend([None] * capacidad)
+                capacidad = len(camino)
+            camino[cuenta] = n
+            cuenta += 1
+            if n & 1:
+                m = 3 * n + 1
+                tz = (m & -m).bit_length() - 1
+                if cuenta + tz >= capacidad:
+                    camino.extend([None] * max(capacidad, tz))
+                    capacidad = len(camino)
+                for k in range(tz):
+                    camino[cuenta] = m >> k
+                    cuenta += 1
+                n = m >> tz
+            else:
+                n >>= 1
+
+        # Fase 2: el resto de la trayectoria cabe en 64 bits, así que se
+        # delega en el núcleo compilado. Solo tiene sentido tras la fase
+        # bignum: si el camino está vacío es que el núcleo ya falló con
+        # este mismo n en la ruta rápida inicial
+        if njit is not None and cuenta > 0:
+            buffer = np.empty(max(64, 8 * (n.bit_length() + 1) ** 2),
+                              dtype=np.uint64)
+            longitud = _collatz_u64(np.uint64(n), buffer)
+            if longitud > 0:
+                del camino[cuenta:]
+                return camino + buffer[:longitud].tolist()
+            # Pico intermedio fuera de 64 bits: seguir con el bucle Python
+
+        # Fase 2 en Python: se llega aquí sin Numba instalado o cuando el
+        # núcleo abortó porque algún pico de la trayectoria desborda los 64
+        # bits. La cola de valores pequeños se resuelve con la tabla contigua,
+        # construida la primera vez que este camino se usa de verdad
+        if self._tabla_plana is None:
+            self._construir_tabla_colas()
+
+        # Iterar hasta entrar en el rango de la tabla de colas o encontrar
+        # un valor con sufijo conocido en la caché LRU
+        while n >= self.TABLA_MAX and n not in cache:
+            if cuenta + 64 >= capacidad:
+                # Trayectoria fuera de lo común: duplicar el buffer
+                camino.extend([None] * capacidad)
+                capacidad = len(camino)
+            camino[cuenta] = n
+            cuenta += 1
+            if n & 1:
+                # 3n+1 siempre es par: colapsar de una vez toda la tira de
+                # divisiones entre 2 contando los ceros finales en binario
+                m = 3 * n + 1
+                tz = (m & -m).bit_length() - 1
+                if cuenta + tz >= capacidad:
+                    camino.extend([None] * max(capacidad, tz))
+                    capacidad = len(camino)
+                for k in range(tz):
+                    camino[cuenta] = m >> k
+                    cuenta += 1
+                n = m >> tz
+            else:
+                n >>= 1
+
+        # Truncar el buffer a lo realmente usado
+        del camino[cuenta:]
+
+        # Recuperar la cola: de la tabla contigua para valores pequeños,
+        # de la caché LRU en caso contrario
+        if n < self.TABLA_MAX:
+            cola = self._cola_tabla(n)
+        else:
+            cache.move_to_end(n)
+            cola = cache[n]
+        secuencia = camino + cola
+
+        # Memorizar los sufijos recién descubiertos (solo valores acotados
+        # que no cubra ya la tabla, para no almacenar enteros de precisión
+        # arbitraria en la caché)
+        for i in range(len(camino)):
+            valor = camino[i]
+            if self.TABLA_MAX <= valor < self.CACHE_MAX_VALOR:
+                cache[valor] = secuencia[i:]
+                if len(cache) > self.CACHE_MAX_ENTRADAS:
+                    cache.popitem(last=False)
+
         return secuencia
 
+    def _construir_tabla_colas(self):
+        """
+        Construye la tabla de colas para todos los valores bajo TABLA_MAX.
+
+        Primero se calculan las longitudes de secuencia con memoización
+        sobre la propia tabla; después se rellena un único buffer int64
+        contiguo copiando, para cada valor, su excursión por encima de sí
+        mismo seguida de la cola ya rellenada del valor en que desemboca,
+        de modo que cada cola queda en memoria consecutiva.
+        """
+        tam = self.TABLA_MAX
+
+        # Longitudes de secuencia (incluyendo el propio valor y el 1 final)
+        pasos = np.zeros(tam, dtype=np.int32)
+        pasos[1] = 1
+        for k in range(2, tam):
+            cadena = []
+            v = k
+            while v >= tam or pasos[v] == 0:
+                cadena.append(v)
+                v = v >> 1 if v % 2 == 0 else 3 * v + 1
+            total = int(pasos[v])
+            for valor in reversed(cadena):
+                total += 1
+                if valor < tam:
+                    pasos[valor] = total
+
+        # Desplazamiento de la cola de cada valor dentro del buffer plano
+        desplaz = np.zeros(tam + 1, dtype=np.int64)
+        np.cumsum(pasos, out=desplaz[1:])
+
+        # Rellenar el buffer: la excursión inicial de cada valor se escribe
+        # a mano y el resto se copia en bloque de una cola ya completa
+        plano = np.empty(int(desplaz[tam]), dtype=np.int64)
+        plano[desplaz[1]] = 1
+        for k in range(2, tam):
+            cadena = [k]
+            v = k >> 1 if k % 2 == 0 else 3 * k + 1
+            while v >= k:
+                cadena.append(v)
+                v = v >> 1 if v % 2 == 0 else 3 * v + 1
+            ini = int(desplaz[k])
+            corte = ini + len(cadena)
+            plano[ini:corte] = cadena
+            resto = int(desplaz[v])
+            plano[corte:ini + pasos[k]] = plano[resto:resto + pasos[v]]
+
+        self._tabla_pasos = pasos
+        self._tabla_desplaz = desplaz
+        self._tabla_plana = plano
+
+    def _cola_tabla(self, n):
+        """
+        Devuelve la secuencia completa de un valor n < TABLA_MAX.
+
+        Es una copia de la porción correspondiente del buffer plano, con
+        los valores ya convertidos a enteros de Python.
+        """
+        ini = int(self._tabla_desplaz[n])
+        return self._tabla_plana[ini:ini + int(self._tabla_pasos[n])].tolist()
+
+    def _paridad(self, secuencia):
+        """
+        Devuelve la paridad de cada término (1 = impar) como array uint8.
+
+        Para secuencias en formato array la máscara se obtiene con un AND
+        vectorizado; el resultado se memoriza para la última secuencia
+        consultada, de modo que las visualizaciones que la comparten no la
+        recalculen.
+
+        Args:
+            secuencia (np.ndarray | list): Secuencia de Collatz
+
+        Returns:
+            np.ndarray: Array uint8 con un 1 en las posiciones impares
+        """
+        if secuencia is self._ultima_secuencia:
+            return self._ultima_paridad
+        if isinstance(secuencia, np.ndarray):
+            paridad = (secuencia & np.uint64(1)).astype(np.uint8)
+        else:
+            paridad = np.fromiter((val & 1 for val in secuencia),
+                                  dtype=np.uint8, count=len(secuencia))
+        self._ultima_secuencia = secuencia
+        self._ultima_paridad = paridad
+        return paridad
+
+    def _submuestrear(self, secuencia):
+        """
+        Reduce una secuencia larga a un tamaño dibujable por matplotlib.
+
+        Matplotlib dibuja cada punto individualmente, así que secuencias de
+        cientos de miles de pasos atascan el renderizado. Si la secuencia
+        supera MAX_PUNTOS_GRAFICA se toma una muestra uniforme de índices
+        equiespaciados (el primer y el último término siempre se conservan);
+        en caso contrario se devuelve intacta.
+
+        Args:
+            secuencia (list): Secuencia completa de Collatz
+
+        Returns:
+            tuple: Par (indices, muestra) donde:
+                - indices (np.ndarray): Posición original de cada punto
+                - muestra (list): Subsecuencia seleccionada para dibujar
+        """
+        total = len(secuencia)
+        if total <= self.MAX_PUNTOS_GRAFICA:
+            return np.arange(total), secuencia
+        indices = np.linspace(0, total - 1,
+                              self.MAX_PUNTOS_GRAFICA).astype(np.int64)
+        if isinstance(secuencia, np.ndarray):
+            # Indexación avanzada: la muestra se extrae en una operación C
+            muestra = secuencia[indices]
+        else:
+            muestra = [secuencia[i] for i in indices]
+        return indices, muestra
+
+    def _anotar_submuestreo(self, fig, mostrados, total):
+        """Añade una nota al pie cuando la gráfica no muestra todos los puntos."""
+        if mostrados < total:
+            fig.text(0.99, 0.01,
+                     f'Mostrando {mostrados:,} de {total:,} puntos',
+                     ha='right', va='bottom', fontsize=8, color='gray')
+
     def mostrar_graficas(self, numero_inicial, secuencia):
         """Muestra las gráficas estáticas originales"""
-        plt.figure(figsize=(12, 8))
-        
-        # Convertir a numpy array para mejor manejo de números grandes
-        seq_array = np.array(secuencia, dtype=object)
+        fig = plt.figure(figsize=(12, 8))
         
+        # Submuestrear secuencias largas y prescindir de los marcadores,
+        # que matplotlib dibuja de uno en uno
+        indices, muestra = self._submuestrear(secuencia)
+        completa = len(muestra) == len(secuencia)
+
+        # Convertir una sola vez a float64: matplotlib normaliza los arrays
+        # numéricos en C, mientras que con dtype=object paga un despacho de
+        # Python por elemento (especialmente caro en la escala logarítmica)
+        if isinstance(muestra, np.ndarray):
+            seq_array = muestra.astype(np.float64)
+        elif max(muestra) < 1e300:
+            seq_array = np.fromiter((float(val) for val in muestra),
+                                    dtype=np.float64, count=len(muestra))
+        else:
+            # Valores que desbordan float64: dibujar log10 calculado con
+            # precisión arbitraria, sin la escala log nativa de matplotlib
+            seq_array = None
+            log_array = np.fromiter((math.log10(val) for val in muestra),
+                                    dtype=np.float64, count=len(muestra))
+
         # Gráfica normal
         plt.subplot(2, 1, 1)
-        plt.plot(range(len(seq_array)), seq_array, 'b-o', label='Secuencia')
+        if seq_array is not None:
+            plt.plot(indices, seq_array, 'b-o' if completa else 'b-',
+                     label='Secuencia')
+            plt.ylabel('Valor')
+        else:
+            plt.plot(indices, log_array, 'b-o' if completa else 'b-',
+                     label='Secuencia (log10)')
+            plt.ylabel('log10(Valor)')
         plt.title(f'Conjetura de Collatz para n = {numero_inicial:,}')
         plt.xlabel('Pasos')
-        plt.ylabel('Valor')
         plt.grid(True)
         plt.legend()
-        
+
         # Gráfica logarítmica
         plt.subplot(2, 1, 2)
-        plt.plot(range(len(seq_array)), seq_array, 'r-o', label='Secuencia (escala log)')
-        plt.yscale('log')
+        if seq_array is not None:
+            plt.plot(indices, seq_array, 'r-o' if completa else 'r-',
+                     label='Secuencia (escala log)')
+            plt.yscale('log')
+            plt.ylabel('Valor (log)')
+        else:
+            plt.plot(indices, log_array, 'r-o' if completa else 'r-',
+                     label='Secuencia (log10)')
+            plt.ylabel('log10(Valor)')
         plt.xlabel('Pasos')
-        plt.ylabel('Valor (log)')
         plt.grid(True)
         plt.legend()
-        
+
+        self._anotar_submuestreo(fig, len(muestra), len(secuencia))
         plt.tight_layout()
         plt.show()
-        
+
         # Mostrar estadísticas con formato para números grandes
         self.mostrar_estadisticas(numero_inicial, secuencia)
 
@@ -224,38 +789,55 @@ class CollatzAnalyzer:
         ax2.set_yscale('log')
         ax2.grid(True)
         
-        # Inicializar líneas vacías
-        line1, = ax1.plot([], [], 'b-o', lw=2)
-        line2, = ax2.plot([], [], 'r-o', lw=2)
-        
-        # Texto para mostrar el valor actual
-        text = ax1.text(0.02, 0.95, '', transform=ax1.transAxes, fontsize=12,
-                        bbox=dict(facecolor='white', alpha=0.7))
-        
         # Establecer límites
         max_val = max(secuencia)
         ax1.set_xlim(0, len(secuencia))
         ax1.set_ylim(0, max_val * 1.1)
         ax2.set_xlim(0, len(secuencia))
         ax2.set_ylim(1, max_val * 1.1)
-        
-        # Función de inicialización
-        def init():
-            line1.set_data([], [])
-            line2.set_data([], [])
-            text.set_text('')
-            return line1, line2, text
-        
-        # Función de animación
-        def animate(i):
-            x = range(i+1)
-            y = secuencia[:i+1]
-            line1.set_data(x, y)
-            line2.set_data(x, y)
-            if i < len(secuencia):
-                text.set_text(f'Paso {i}: {secuencia[i]:,}')
-            return line1, line2, text
-        
+
+        # Submuestrear secuencias largas antes de animar
+        indices, muestra = self._submuestrear(secuencia)
+        completa = len(muestra) == len(secuencia)
+        self._anotar_submuestreo(fig, len(muestra), len(secuencia))
+
+        # Precalcular los datos una sola vez; los cortes posteriores son
+        # vistas sobre estos arrays, sin copias por fotograma
+        xs = indices
+        ys = np.asarray(muestra, dtype=np.float64)
+
+        # Artistas animados: dos líneas y el texto de progreso. El resto de
+        # la figura (ejes, rejilla, títulos) se dibuja una única vez y se
+        # restaura como fondo mediante blitting manual.
+        line1, = ax1.plot([], [], 'b-o' if completa else 'b-',
+                          lw=2, animated=True)
+        line2, = ax2.plot([], [], 'r-o' if completa else 'r-',
+                          lw=2, animated=True)
+        texto = ax1.text(0.02, 0.95, '', transform=ax1.transAxes, fontsize=12,
+                         bbox=dict(facecolor='white', alpha=0.7),
+                         animated=True)
+
+        gestor = _BlitManager(fig.canvas, (line1, line2, texto))
+
+        # Índice del fotograma actual, compartido con los controles
+        estado = {'i': 0}
+
+        def avanzar():
+            """Dibuja el siguiente fotograma y detiene el timer al terminar."""
+            i = estado['i']
+            if i >= len(muestra):
+                timer.stop()
+                return
+            line1.set_data(xs[:i+1], ys[:i+1])
+            line2.set_data(xs[:i+1], ys[:i+1])
+            texto.set_text(f'Paso {indices[i]}: {muestra[i]:,}')
+            gestor.actualizar()
+            estado['i'] = i + 1
+
+        # Timer que dirige el bucle de animación
+        timer = fig.canvas.new_timer(interval=self.animation_speed)
+        timer.add_callback(avanzar)
+
         # Crear botones para controlar la animación
         plt.subplots_adjust(bottom=0.2)
         
@@ -273,66 +855,128 @@ class CollatzAnalyzer:
         reset_button = Button(reset_ax, 'Reset')
         speed_slider = Slider(speed_ax, 'Velocidad', 10, 500, valinit=self.animation_speed)
         
-        # Crear la animación
-        ani = animation.FuncAnimation(fig, animate, frames=len(secuencia),
-                                      init_func=init, interval=self.animation_speed, 
-                                      blit=True, repeat=False)
-        
-        self.current_animation = ani
-        
+        # Guardar el timer que dirige la animación actual
+        self.current_animation = timer
+
         # Funciones de control
         def play(event):
-            self.current_animation.event_source.start()
-            
+            timer.start()
+
         def pause(event):
-            self.current_animation.event_source.stop()
-            
+            timer.stop()
+
         def reset(event):
-            self.current_animation.frame_seq = self.current_animation.new_frame_seq()
-            self.current_animation.event_source.start()
-            
+            estado['i'] = 0
+            timer.start()
+
         def update_speed(val):
             self.animation_speed = int(val)
-            self.current_animation.event_source.interval = self.animation_speed
-        
+            timer.interval = self.animation_speed
+
         # Conectar los eventos
         play_button.on_clicked(play)
         pause_button.on_clicked(pause)
         reset_button.on_clicked(reset)
         speed_slider.on_changed(update_speed)
-        
+
+        timer.start()
         plt.show()
-        
+
         # Mostrar estadísticas después de la animación
         self.mostrar_estadisticas(numero_inicial, secuencia)
 
+        # Ofrecer la exportación de la animación a vídeo
+        if iio is not None:
+            exportar = input("\n¿Desea exportar la animación a vídeo? (s/n): ").lower() == 's'
+            if exportar:
+                archivo = input("Nombre del archivo (con extensión .gif o .mp4): ").strip()
+                if archivo:
+                    self.exportar_animacion(numero_inicial, secuencia, archivo)
+
+    def exportar_animacion(self, numero_inicial, secuencia, archivo):
+        """
+        Exporta la animación de la secuencia a un archivo de vídeo.
+
+        Cada fotograma es una figura de matplotlib independiente y limitada
+        por CPU, así que se renderizan en paralelo en un pool de procesos y
+        después se escriben en orden con imageio. El número de fotogramas se
+        limita a MAX_FOTOGRAMAS_VIDEO muestreando pasos equiespaciados.
+
+        Args:
+            numero_inicial (int): Número que generó la secuencia
+            secuencia (np.ndarray | list): Secuencia de Collatz completa
+            archivo (str): Ruta del vídeo de salida (.gif o .mp4)
+
+        Returns:
+            None
+        """
+        if iio is None:
+            print("\nPara exportar animaciones instale imageio (pip install imageio)")
+            return
+
+        # Reducir la secuencia a un tamaño dibujable y acotar los fotogramas
+        indices, muestra = self._submuestrear(secuencia)
+        xs = np.asarray(indices, dtype=np.int64)
+        ys = np.asarray(muestra, dtype=np.float64)
+        cortes = np.linspace(0, len(muestra) - 1,
+                             min(len(muestra), self.MAX_FOTOGRAMAS_VIDEO),
+                             dtype=np.int64)
+
+        print(f"\nRenderizando {len(cortes)} fotogramas en paralelo...")
+        trabajos = [(int(i), xs, ys, numero_inicial) for i in cortes]
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as ejecutor:
+            fotogramas = list(ejecutor.map(_renderizar_fotograma, trabajos))
+
+        try:
+            iio.imwrite(archivo, fotogramas)
+        except (OSError, ValueError) as e:
+            print(f"\nError al escribir el vídeo: {e}")
+            return
+        print(f"Animación exportada a {archivo}")
+
     def mostrar_espiral(self, numero_inicial, secuencia):
         """Muestra la secuencia como una espiral"""
         # Crear figura
         fig = plt.figure(figsize=(10, 10))
         ax = fig.add_subplot(111)
         
+        # Submuestrear secuencias largas antes de calcular la espiral
+        indices, muestra = self._submuestrear(secuencia)
+        self._anotar_submuestreo(fig, len(muestra), len(secuencia))
+
         # Calcular ángulos y radios para la espiral
-        n = len(secuencia)
+        n = len(muestra)
         theta = np.linspace(0, 10*np.pi, n)  # 10 vueltas
-        
-        # Normalizar los valores para el radio
+
+        # Normalizar los valores para el radio (una sola conversión a NumPy
+        # en lugar de una comprensión de listas por punto; la división se
+        # hace sobre el propio array convertido)
         max_val = max(secuencia)
-        radii = np.array([val/max_val for val in secuencia])
-        
-        # Convertir a coordenadas cartesianas
-        x = theta * np.cos(theta) * radii
-        y = theta * np.sin(theta) * radii
-        
-        # Crear colores basados en si el número es par o impar
-        colors = ['blue' if val % 2 == 0 else 'red' for val in secuencia]
-        
-        # Dibujar la espiral con puntos coloreados
-        scatter = ax.scatter(x, y, c=colors, s=50, alpha=0.7)
+        radii = np.asarray(muestra, dtype=np.float64)
+        np.divide(radii, float(max_val), out=radii)
+
+        # Convertir a coordenadas cartesianas con operaciones in situ: un
+        # único buffer temporal compartido en lugar de dos o tres arrays
+        # intermedios por eje, que es lo que domina el coste en secuencias
+        # que exceden la caché del procesador
+        x = np.empty(n)
+        y = np.empty(n)
+        tmp = np.empty(n)
+        np.cos(theta, out=tmp)
+        np.multiply(theta, tmp, out=x)
+        np.multiply(x, radii, out=x)
+        np.sin(theta, out=tmp)
+        np.multiply(theta, tmp, out=y)
+        np.multiply(y, radii, out=y)
+
+        # Crear colores basados en si el número es par o impar, a partir de
+        # la máscara de paridad compartida
+        paridad = self._paridad(secuencia)[indices]
+        colors = np.where(paridad, 'red', 'blue')
         
         # Dibujar líneas conectando los puntos
         ax.plot(x, y, 'gray', alpha=0.3)
-        
+
         # Añadir título y leyenda
         ax.set_title(f'Espiral de Collatz para n = {numero_inicial:,}')
         ax.axis('equal')
@@ -346,19 +990,16 @@ class CollatzAnalyzer:
         ]
         ax.legend(handles=legend_elements, loc='upper right')
         
-        # Animación de la espiral
-        def init():
-            scatter.set_offsets(np.column_stack([[], []]))
-            return scatter,
-        
-        def animate(i):
-            data = np.column_stack([x[:i+1], y[:i+1]])
-            scatter.set_offsets(data)
-            return scatter,
-        
-        ani = animation.FuncAnimation(fig, animate, frames=n,
-                                     init_func=init, interval=50, 
-                                     blit=True, repeat=False)
+        # Animación de la espiral: un artista por fotograma, creado una sola
+        # vez sobre vistas de los arrays ya calculados
+        frames = []
+        for i in range(n):
+            puntos = ax.scatter(x[:i+1], y[:i+1], c=colors[:i+1],
+                                s=50, alpha=0.7, animated=True)
+            frames.append([puntos])
+
+        ani = animation.ArtistAnimation(fig, frames, interval=50,
+                                        blit=True, repeat=False)
         
         plt.show()
         
@@ -369,42 +1010,33 @@ class CollatzAnalyzer:
         """Muestra un árbol de decisiones para la secuencia de Collatz"""
         # Crear figura
         fig, ax = plt.subplots(figsize=(12, 8))
-        
-        # Inicializar posiciones
-        x = [0]  # Posición x inicial
-        y = [0]  # Posición y inicial
-        
-        # Crear posiciones para cada número en la secuencia
-        for i in range(1, len(secuencia)):
-            prev_val = secuencia[i-1]
-            curr_val = secuencia[i]
-            
-            # Si el número anterior era par, moverse a la derecha y abajo
-            if prev_val % 2 == 0:
-                x.append(x[-1] + 1)
-                y.append(y[-1] - 0.5)
-            # Si era impar, moverse a la izquierda y abajo
-            else:
-                x.append(x[-1] - 1)
-                y.append(y[-1] - 0.5)
-        
+
+        # Submuestrear secuencias largas antes de construir el árbol
+        indices, muestra = self._submuestrear(secuencia)
+        self._anotar_submuestreo(fig, len(muestra), len(secuencia))
+
+        # Posiciones del recorrido a partir de la máscara de paridad: cada
+        # paso se mueve a la derecha si el valor anterior era par y a la
+        # izquierda si era impar, siempre medio paso hacia abajo. Con Numba
+        # se resuelve en una única pasada compilada sin arrays temporales;
+        # si no, con la variante vectorizada de NumPy
+        paridad = self._paridad(secuencia)[indices]
+        if njit is not None:
+            x, y = _posiciones_arbol(paridad)
+        else:
+            dx = np.where(paridad[:-1], -1.0, 1.0)
+            x = np.concatenate([[0.0], np.cumsum(dx)])
+            y = -0.5 * np.arange(len(muestra), dtype=np.float64)
+
         # Normalización de valores para visualización
         # Convertimos explícitamente a float para evitar desbordamientos con números grandes
         # y problemas con la función isnan() en la visualización
         max_val = float(max(secuencia))
-        
+
         # Creamos valores normalizados en el rango [0,1] para el mapa de colores
-        norm_values = [float(val) / max_val for val in secuencia]
-        
-        # Aplicamos el mapa de colores 'viridis' a los valores normalizados
-        colors = plt.cm.viridis(norm_values)
-        
-        # Inicializar scatter plot
-        scatter = ax.scatter([], [], s=100, c=[], cmap='viridis')
-        
-        # Inicializar líneas
-        line, = ax.plot([], [], 'gray', alpha=0.5)
-        
+        # (división vectorizada en lugar de una comprensión por elemento)
+        norm_values = np.asarray(muestra, dtype=np.float64) / max_val
+
         # Configurar ejes
         ax.set_title(f'Árbol de Collatz para n = {numero_inicial:,}')
         ax.set_xlabel('Dirección (izquierda: impar, derecha: par)')
@@ -421,23 +1053,38 @@ class CollatzAnalyzer:
         cbar = plt.colorbar(sm, ax=ax)
         cbar.set_label('Valor en la secuencia')
         
-        # Función de animación
-        def init():
-            scatter.set_offsets(np.empty((0, 2)))
-            line.set_data([], [])
-            return scatter, line
-        
-        def animate(i):
-            data = np.column_stack([x[:i+1], y[:i+1]])
-            scatter.set_offsets(data)
-            scatter.set_color(colors[:i+1])
-            line.set_data(x[:i+1], y[:i+1])
-            return scatter, line
-        
-        ani = animation.FuncAnimation(fig, animate, frames=len(secuencia),
-                                     init_func=init, interval=50, 
-                                     blit=True, repeat=False)
-        
+        # Construir todos los segmentos del recorrido una sola vez: una
+        # LineCollection coloreada por el valor de origen se dibuja en una
+        # única pasada, en lugar de un punto de scatter por paso
+        pts = np.column_stack([x, y]).reshape(-1, 1, 2)
+        segs = np.concatenate([pts[:-1], pts[1:]], axis=1)
+        valores = norm_values[:-1]
+
+        lc = LineCollection(segs, cmap='viridis', lw=2, animated=True)
+        lc.set_array(valores)
+        lc.set_clim(0.0, 1.0)
+        ax.add_collection(lc)
+
+        # Animación del árbol: cada fotograma recorta vistas de los arrays
+        # ya construidos (una actualización a nivel de C por paso) y se
+        # compone mediante blitting manual
+        gestor = _BlitManager(fig.canvas, (lc,))
+        estado = {'i': 0}
+
+        def avanzar():
+            i = estado['i']
+            if i > len(segs):
+                timer.stop()
+                return
+            lc.set_segments(segs[:i])
+            lc.set_array(valores[:i])
+            gestor.actualizar()
+            estado['i'] = i + 1
+
+        timer = fig.canvas.new_timer(interval=50)
+        timer.add_callback(avanzar)
+        timer.start()
+
         plt.tight_layout()
         plt.show()
         
@@ -643,25 +1290,37 @@ class CollatzAnalyzer:
                 except ValueError:
                     print("Por favor, ingrese un número válido")
             
-            # Generar secuencias
-            secuencia1 = self.collatz(numero1)
-            secuencia2 = self.collatz(numero2)
+            # Generar las dos secuencias en paralelo: son cálculos
+            # independientes y el núcleo de Numba libera el GIL, así que
+            # dos hilos bastan para solaparlos (la caché en disco también
+            # se consulta de forma concurrente)
+            with ThreadPoolExecutor(max_workers=2) as ejecutor:
+                futuro1 = ejecutor.submit(self._cached_collatz, numero1)
+                futuro2 = ejecutor.submit(self._cached_collatz, numero2)
+                secuencia1 = futuro1.result()
+                secuencia2 = futuro2.result()
             
+            # Submuestrear secuencias largas antes de dibujar
+            indices1, muestra1 = self._submuestrear(secuencia1)
+            indices2, muestra2 = self._submuestrear(secuencia2)
+
             # Crear figura para comparación
             fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
             fig.suptitle(f'Comparación de secuencias: {numero1:,} vs {numero2:,}', fontsize=16)
-            
+            self._anotar_submuestreo(fig, len(muestra1) + len(muestra2),
+                                     len(secuencia1) + len(secuencia2))
+
             # Gráfica normal
-            ax1.plot(range(len(secuencia1)), secuencia1, 'b-', label=f'n = {numero1:,}')
-            ax1.plot(range(len(secuencia2)), secuencia2, 'r-', label=f'n = {numero2:,}')
+            ax1.plot(indices1, muestra1, 'b-', label=f'n = {numero1:,}')
+            ax1.plot(indices2, muestra2, 'r-', label=f'n = {numero2:,}')
             ax1.set_xlabel('Pasos')
             ax1.set_ylabel('Valor')
             ax1.grid(True)
             ax1.legend()
-            
+
             # Gráfica logarítmica
-            ax2.plot(range(len(secuencia1)), secuencia1, 'b-', label=f'n = {numero1:,}')
-            ax2.plot(range(len(secuencia2)), secuencia2, 'r-', label=f'n = {numero2:,}')
+            ax2.plot(indices1, muestra1, 'b-', label=f'n = {numero1:,}')
+            ax2.plot(indices2, muestra2, 'r-', label=f'n = {numero2:,}')
             ax2.set_yscale('log')
             ax2.set_xlabel('Pasos')
             ax2.set_ylabel('Valor (log)')